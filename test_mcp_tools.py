@@ -2,19 +2,47 @@
 """
 Test script for SimpleDB MCP Server tools
 Tests all available MCP tools via HTTP transport
-Uses only Python 3.13 standard library
+Uses only Python 3.13 standard library (orjson is used when available)
 """
 
+import http.client
+import io
+import itertools
 import json
+import re
 import sys
-import urllib.request
+import threading
 import urllib.parse
-import urllib.error
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    import orjson
 
-@dataclass
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    _loads = json.loads
+
+# Shared read-only default for requests without params
+_EMPTY: Dict[str, Any] = {}
+
+# System databases skipped when picking databases to test
+_SYSTEM_DBS = frozenset({"information_schema", "performance_schema", "mysql", "sys", "innodb"})
+# System databases used when a server has no user databases
+_FALLBACK_DBS = frozenset({"information_schema", "mysql"})
+
+# Fallback formats like "Found databases: db1, db2" and "Found tables: t1, t2";
+# the list runs up to the next colon and may span lines
+_DBS_RE = re.compile(r"databases\s*:\s*([^:]+)", re.IGNORECASE)
+_TABLES_RE = re.compile(r"tables\s*:\s*([^:]+)", re.IGNORECASE)
+
+
+@dataclass(slots=True)
 class TestResult:
     tool_name: str
     success: bool
@@ -23,48 +51,184 @@ class TestResult:
 
 
 class MCPTester:
-    def __init__(self, base_url: str = "http://localhost:48384/mcp"):
+    _HEADERS = {
+        'Content-Type': 'application/json',
+        'Connection': 'keep-alive'
+    }
+    
+    def __init__(self, base_url: str = "http://localhost:48384/mcp", max_workers: int = 8):
         self.base_url = base_url
-        
+        # Upper bound on database connections tested concurrently; each worker
+        # thread holds its own keep-alive HTTP connection while the pool runs
+        self.max_workers = max(1, max_workers)
+        # Enabled by initialize_server only if the server negotiates batching
+        self.batch_supported = False
+        self._conn_type: Dict[str, str] = {}
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        # Output buffer while a buffered comprehensive test runs, None writes to stdout
+        self._log: Optional[io.StringIO] = None
+        
+        # Parse the URL once; each thread reuses its own keep-alive connection
+        url = urllib.parse.urlsplit(base_url)
+        if url.scheme not in ("http", "https"):
+            raise ValueError(f"Invalid MCP server URL {base_url!r}: scheme must be http or https")
+        if not url.hostname:
+            raise ValueError(f"Invalid MCP server URL {base_url!r}: missing host")
+        try:
+            port = url.port
+        except ValueError as e:
+            raise ValueError(f"Invalid MCP server URL {base_url!r}: {e}") from None
+        self._scheme = url.scheme
+        # Pass the port explicitly: with port=None http.client would split an
+        # IPv6 literal on its last colon. It brackets IPv6 hosts in the Host header.
+        self._host = url.hostname
+        self._port = port or (443 if url.scheme == "https" else 80)
+        self._path = (url.path or "/") + (f"?{url.query}" if url.query else "")
+        self._local = threading.local()
+        # Open HTTP connections keyed by the ident of the thread that owns them
+        self._conns: Dict[int, http.client.HTTPConnection] = {}
+        self._lock = threading.Lock()
+        
+        # Request ids are unique per tester so batch responses can be matched by id
+        self._next_id = itertools.count(1)
+    
+    def __enter__(self) -> "MCPTester":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close all HTTP connections to the MCP server"""
+        with self._lock:
+            for conn in self._conns.values():
+                conn.close()
+    
+    def _close_worker_connections(self) -> None:
+        """Close and forget connections owned by threads other than the caller's"""
+        current = threading.get_ident()
+        with self._lock:
+            for ident in [ident for ident in self._conns if ident != current]:
+                self._conns.pop(ident).close()
+        
+    def _p(self, *args) -> None:
+        """Print to the output buffer if one is active, otherwise to stdout"""
+        print(*args, file=self._log)
+    
     def send_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Send a JSON-RPC request to the MCP server"""
-        request_id = 1
         payload = {
             "jsonrpc": "2.0",
-            "id": request_id,
+            "id": next(self._next_id),
             "method": method,
-            "params": params or {}
+            "params": params or _EMPTY
         }
+        return self._post(_dumps(payload))
+    
+    def send_batch(self, requests: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """Send several JSON-RPC requests in a single batch.
+        
+        Returns the responses in request order, or None if the server
+        answered with something other than a batch response. If the server
+        cannot be reached, every request gets the connection error instead.
+        """
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": next(self._next_id),
+                "method": request["method"],
+                "params": request.get("params") or _EMPTY
+            }
+            for request in requests
+        ]
         
         try:
-            # Prepare the request
-            data = json.dumps(payload).encode('utf-8')
-            req = urllib.request.Request(
-                self.base_url,
-                data=data,
-                headers={
-                    'Content-Type': 'application/json',
-                    'Content-Length': str(len(data))
-                }
-            )
-            
-            # Send the request
-            with urllib.request.urlopen(req, timeout=30) as response:
-                response_data = response.read().decode('utf-8')
-                return json.loads(response_data)
-                
-        except urllib.error.HTTPError as e:
-            return {"error": f"HTTP Error {e.code}: {e.reason}"}
-        except urllib.error.URLError as e:
-            return {"error": f"URL Error: {e.reason}"}
-        except json.JSONDecodeError as e:
-            return {"error": f"JSON Decode Error: {str(e)}"}
+            status, reason, body = self._send(_dumps(payload))
+        except Exception as e:
+            # The server was never reached, so this says nothing about batch support
+            error = self._transport_error(e)
+            return [error for _ in payload]
+        
+        response = self._response(status, reason, body)
+        if not isinstance(response, list):
+            return None
+        
+        # Batch responses may arrive in any order, match them back by id
+        by_id = {item.get("id"): item for item in response if isinstance(item, dict)}
+        return [
+            by_id.get(request["id"], {"error": f"No response for request id {request['id']}"})
+            for request in payload
+        ]
+    
+    def _post(self, data: bytes) -> Any:
+        """POST an encoded JSON-RPC payload and return the decoded response"""
+        try:
+            status, reason, body = self._send(data)
         except Exception as e:
-            return {"error": f"Request failed: {str(e)}"}
+            return self._transport_error(e)
+        return self._response(status, reason, body)
+    
+    def _send(self, data: bytes) -> Tuple[int, str, bytes]:
+        """POST data over the persistent connection, reconnecting once if it went stale"""
+        try:
+            return self._exchange(data)
+        except (http.client.BadStatusLine, ConnectionError):
+            # The server may have dropped the idle keep-alive connection;
+            # a closed HTTPConnection reconnects on its next request
+            self._close_connection()
+            return self._exchange(data)
+    
+    def _response(self, status: int, reason: str, body: bytes) -> Any:
+        """Decode an HTTP reply from the server into a JSON-RPC response"""
+        if status >= 400:
+            return {"error": f"HTTP Error {status}: {reason}"}
+        try:
+            return _loads(body)
+        except ValueError as e:
+            return {"error": f"JSON Decode Error: {str(e)}"}
+    
+    def _transport_error(self, e: Exception) -> Dict[str, Any]:
+        """Reset the connection after a failed request and describe the failure"""
+        self._close_connection()
+        if isinstance(e, (OSError, http.client.HTTPException)):
+            return {"error": f"Connection Error: {str(e)}"}
+        return {"error": f"Request failed: {str(e)}"}
+    
+    def _connection(self) -> http.client.HTTPConnection:
+        """Return the calling thread's persistent connection, creating it if needed"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self._scheme == "https":
+                conn = http.client.HTTPSConnection(self._host, self._port, timeout=30)
+            else:
+                conn = http.client.HTTPConnection(self._host, self._port, timeout=30)
+            self._local.conn = conn
+            with self._lock:
+                # A finished thread's ident may be reused; never orphan its connection
+                stale = self._conns.get(threading.get_ident())
+                if stale is not None:
+                    stale.close()
+                self._conns[threading.get_ident()] = conn
+        return conn
+    
+    def _close_connection(self) -> None:
+        """Close the calling thread's connection, if it has one"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+    
+    def _exchange(self, data: bytes) -> Tuple[int, str, bytes]:
+        """Send one POST over the persistent connection and read the full reply"""
+        conn = self._connection()
+        conn.request("POST", self._path, body=data, headers=self._HEADERS)
+        response = conn.getresponse()
+        return response.status, response.reason, response.read()
     
     def initialize_server(self) -> bool:
         """Initialize the MCP server"""
-        print("🔧 Initializing MCP server...")
+        self._p("🔧 Initializing MCP server...")
+        # A new session may expose a different tool set
+        self._tools_cache = None
         response = self.send_request("initialize", {
             "protocolVersion": "2024-11-05",
             "capabilities": {},
@@ -72,31 +236,38 @@ class MCPTester:
         })
         
         if "error" in response:
-            print(f"❌ Failed to initialize: {response['error']}")
+            self._p(f"❌ Failed to initialize: {response['error']}")
             return False
             
         if "result" in response:
-            print("✅ Server initialized successfully")
+            # MCP allowed JSON-RPC batches only in protocol 2025-03-26
+            protocol_version = response["result"].get("protocolVersion", "")
+            self.batch_supported = protocol_version == "2025-03-26"
+            self._p("✅ Server initialized successfully")
             return True
             
-        print(f"❌ Unexpected response: {response}")
+        self._p(f"❌ Unexpected response: {response}")
         return False
     
     def get_available_tools(self) -> List[Dict[str, Any]]:
-        """Get list of available tools from the server"""
-        print("📋 Getting available tools...")
+        """Get list of available tools from the server, cached until the next initialize"""
+        if self._tools_cache is not None:
+            return self._tools_cache
+        
+        self._p("📋 Getting available tools...")
         response = self.send_request("tools/list")
         
         if "error" in response:
-            print(f"❌ Failed to get tools: {response['error']}")
+            self._p(f"❌ Failed to get tools: {response['error']}")
             return []
             
         if "result" in response and "tools" in response["result"]:
             tools = response["result"]["tools"]
-            print(f"✅ Found {len(tools)} tools")
+            self._p(f"✅ Found {len(tools)} tools")
+            self._tools_cache = tools
             return tools
             
-        print(f"❌ Unexpected response: {response}")
+        self._p(f"❌ Unexpected response: {response}")
         return []
     
     def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> TestResult:
@@ -105,7 +276,27 @@ class MCPTester:
             "name": tool_name,
             "arguments": arguments
         })
-        
+        return self._tool_result(tool_name, response)
+    
+    def call_tools_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[TestResult]:
+        """Call several tools in one JSON-RPC batch, sequentially if unsupported"""
+        if self.batch_supported:
+            responses = self.send_batch([
+                {"method": "tools/call", "params": {"name": tool_name, "arguments": arguments}}
+                for tool_name, arguments in calls
+            ])
+            if responses is not None:
+                return [
+                    self._tool_result(tool_name, response)
+                    for (tool_name, _), response in zip(calls, responses)
+                ]
+            # The server answered but not with a batch response
+            self.batch_supported = False
+        
+        return [self.call_tool(tool_name, arguments) for tool_name, arguments in calls]
+    
+    def _tool_result(self, tool_name: str, response: Dict[str, Any]) -> TestResult:
+        """Convert a tools/call response into a TestResult"""
         if "error" in response:
             return TestResult(
                 tool_name=tool_name,
@@ -140,72 +331,59 @@ class MCPTester:
         return self.call_tool("get_pool_metrics", {})
     
     def test_get_connection_status(self) -> TestResult:
-        """Test the get_connection_status tool"""
-        # Test with no specific connection (should return all)
+        """Test the get_connection_status tool
+        
+        Called without a connection so one request returns the status of
+        every connection; per-connection calls would only repeat a subset.
+        """
         return self.call_tool("get_connection_status", {})
     
     def test_with_connection(self, connection_name: str) -> List[TestResult]:
         """Test tools that require a connection name"""
-        results = []
-        
-        # Test list_databases
-        results.append(self.call_tool("list_databases", {
-            "connection": connection_name
-        }))
-        
-        # Test get_connection_status for specific connection
-        results.append(self.call_tool("get_connection_status", {
+        # get_connection_status is covered by the all-connections call in step 1
+        return [self.call_tool("list_databases", {
             "connection": connection_name
-        }))
-        
-        return results
+        })]
     
     def test_with_database(self, connection_name: str, database_name: str) -> List[TestResult]:
         """Test tools that require connection and database"""
-        results = []
-        
-        # Test list_tables
-        results.append(self.call_tool("list_tables", {
-            "connection": connection_name,
-            "database": database_name
-        }))
-        
-        # Test list_schemas (PostgreSQL only, but won't hurt to try)
-        results.append(self.call_tool("list_schemas", {
+        args = {
             "connection": connection_name,
             "database": database_name
-        }))
-        
-        return results
+        }
+        return self.call_tools_batch([
+            ("list_tables", args),
+            # Test list_schemas (PostgreSQL only, but won't hurt to try)
+            ("list_schemas", args),
+        ])
     
     def test_with_table(self, connection_name: str, database_name: str, table_name: str) -> List[TestResult]:
         """Test tools that require connection, database, and table"""
-        results = []
-        
-        # Test describe_table
-
-        results.append(self.call_tool("describe_table", {
+        args = {
             "connection": connection_name,
             "database": database_name,
             "table": table_name
-        }))
-        
-        # Test list_indexes
-        results.append(self.call_tool("list_indexes", {
-            "connection": connection_name,
-            "database": database_name,
-            "table": table_name
-        }))
-        
-        # Test get_table_sample
-        results.append(self.call_tool("get_table_sample", {
-            "connection": connection_name,
-            "database": database_name,
-            "table": table_name,
-            "limit": 5
-        }))
-        
-        return results
+        }
+        return self.call_tools_batch([
+            ("describe_table", args),
+            ("list_indexes", args),
+            ("get_table_sample", {**args, "limit": 5}),
+        ])
+    
+    def _text_payloads(self, result: TestResult) -> Iterator[Tuple[str, Any]]:
+        """Yield each text content item with its JSON-decoded value (None if not JSON)
+        
+        Items are decoded lazily, so extractors that stop at the first match
+        never parse the remaining items.
+        """
+        for item in result.response["result"]["content"]:
+            if item.get("type") == "text":
+                text = item.get("text", "")
+                try:
+                    parsed = _loads(text)
+                except (json.JSONDecodeError, ValueError):
+                    parsed = None
+                yield text, parsed
     
     def extract_databases_from_response(self, result: TestResult) -> List[str]:
         """Extract database names from list_databases response"""
@@ -213,103 +391,74 @@ class MCPTester:
             return []
         
         try:
-            content = result.response["result"]["content"]
             databases = []
             
             # Look for database names in the response content
-            for item in content:
-                if item.get("type") == "text":
-                    text = item.get("text", "")
-                    
-                    # Try to parse as JSON array first (new format)
-                    try:
-                        import json
-                        databases = json.loads(text)
-                        if isinstance(databases, list):
-                            break
-                    except (json.JSONDecodeError, ValueError):
-                        pass
-                    
-                    # Handle old format like "[db1 db2 db3 db4]" - space separated in brackets
-                    if text.startswith("[") and text.endswith("]"):
-                        # Remove brackets and split by spaces
-                        db_string = text[1:-1].strip()
-                        if db_string:
-                            databases = db_string.split()
-                    # Handle format: "Found databases: db1, db2, db3"
-                    elif "databases:" in text.lower():
-                        parts = text.split(":")
-                        if len(parts) > 1:
-                            db_list = parts[1].strip().split(",")
-                            databases.extend([db.strip() for db in db_list if db.strip()])
-            
-            # Filter out common system databases and limit results
-            filtered_databases = []
-            system_dbs = {"information_schema", "performance_schema", "mysql", "sys", "innodb"}
-            
-            for db in databases:
-                if db.lower() not in system_dbs:
-                    filtered_databases.append(db)
-                if len(filtered_databases) >= 3:  # Max 3 user databases
-                    break
-            
-            # If no user databases found, include a few system ones for testing
-            if not filtered_databases:
-                for db in databases:
-                    if db.lower() in {"information_schema", "mysql"}:
-                        filtered_databases.append(db)
-                    if len(filtered_databases) >= 2:
-                        break
+            for text, parsed in self._text_payloads(result):
+                # JSON array (new format)
+                if isinstance(parsed, list):
+                    return self._filter_databases(parsed)
+                # Handle old format like "[db1 db2 db3 db4]" - space separated in brackets
+                elif text[:1] == "[" and text[-1:] == "]":
+                    # Remove brackets and split by spaces
+                    db_string = text[1:-1].strip()
+                    if db_string:
+                        databases = db_string.split()
+                # Handle format: "Found databases: db1, db2, db3"
+                elif m := _DBS_RE.search(text):
+                    databases.extend([db.strip() for db in m.group(1).split(",") if db.strip()])
             
-            return filtered_databases
+            return self._filter_databases(databases)
         except (KeyError, IndexError, TypeError):
             return []
     
+    def _filter_databases(self, databases: List[str]) -> List[str]:
+        """Filter out common system databases and limit results"""
+        # Max 3 user databases
+        filtered_databases = list(itertools.islice((db for db in databases if db.lower() not in _SYSTEM_DBS), 3))
+        
+        # If no user databases found, include a few system ones for testing
+        if not filtered_databases:
+            filtered_databases = list(itertools.islice((db for db in databases if db.lower() in _FALLBACK_DBS), 2))
+        
+        return filtered_databases
+    
     def extract_tables_from_response(self, result: TestResult) -> List[str]:
         """Extract table names from list_tables response"""
         if not result.success or result.error:
             return []
         
         try:
-            content = result.response["result"]["content"]
             tables = []
             
             # Look for table names in the response content
-            for item in content:
-                if item.get("type") == "text":
-                    text = item.get("text", "")
-                    
-                    # Try to parse as JSON array first (new format)
-                    try:
-                        import json
-                        table_data = json.loads(text)
-                        if isinstance(table_data, list):
-                            # Extract table names from TableInfo objects or strings
-                            for table in table_data:
-                                if isinstance(table, dict) and "name" in table:
-                                    tables.append(table["name"])
-                                elif isinstance(table, str):
-                                    tables.append(table)
-                            break
-                    except (json.JSONDecodeError, ValueError):
-                        pass
-                    
-                    # Handle old format like "[table1 table2 table3]" - space separated in brackets
-                    if text.startswith("[") and text.endswith("]"):
-                        # Remove brackets and split by spaces
-                        table_string = text[1:-1].strip()
-                        if table_string:
-                            tables = table_string.split()
-                    # Handle format: "Found tables: table1, table2, table3"
-                    elif "tables:" in text.lower():
-                        parts = text.split(":")
-                        if len(parts) > 1:
-                            table_list = parts[1].strip().split(",")
-                            tables.extend([t.strip() for t in table_list if t.strip()])
+            for text, parsed in self._text_payloads(result):
+                # JSON array (new format)
+                if isinstance(parsed, list):
+                    return self._filter_tables(parsed)
+                # Handle old format like "[table1 table2 table3]" - space separated in brackets
+                elif text[:1] == "[" and text[-1:] == "]":
+                    # Remove brackets and split by spaces
+                    table_string = text[1:-1].strip()
+                    if table_string:
+                        tables = table_string.split()
+                # Handle format: "Found tables: table1, table2, table3"
+                elif m := _TABLES_RE.search(text):
+                    tables.extend([t.strip() for t in m.group(1).split(",") if t.strip()])
             
-            return tables[:2]  # Return max 2 tables to avoid too many tests
+            return self._filter_tables(tables)
         except (KeyError, IndexError, TypeError):
             return []
+    
+    def _filter_tables(self, table_data: List[Any]) -> List[str]:
+        """Extract table names from TableInfo objects or strings and limit results"""
+        tables = []
+        for table in table_data:
+            if isinstance(table, dict) and "name" in table:
+                tables.append(table["name"])
+            elif isinstance(table, str):
+                tables.append(table)
+        return tables[:2]  # Return max 2 tables to avoid too many tests
 
     def extract_connections_from_response(self, result: TestResult) -> List[Dict[str, Any]]:
         """Extract connection info from list_connections response"""
@@ -317,31 +466,52 @@ class MCPTester:
             return []
         
         try:
-            content = result.response["result"]["content"]
-            for item in content:
-                if item.get("type") == "text":
-                    text = item.get("text", "")
-                    try:
-                        import json
-                        connections = json.loads(text)
-                        if isinstance(connections, list):
-                            return connections
-                    except (json.JSONDecodeError, ValueError):
-                        pass
+            for _, connections in self._text_payloads(result):
+                if isinstance(connections, list):
+                    return connections
             return []
         except (KeyError, IndexError, TypeError):
             return []
 
-    def get_database_type(self, connections: List[Dict[str, Any]], connection_name: str) -> str:
+    def extract_connection_status_from_response(self, result: TestResult) -> Dict[str, Dict[str, Any]]:
+        """Extract per-connection status from an all-connections get_connection_status response"""
+        if not result.success or result.error:
+            return {}
+        
+        try:
+            for _, status in self._text_payloads(result):
+                if isinstance(status, dict) and isinstance(status.get("connections"), dict):
+                    # Skip malformed entries so callers can rely on dict values
+                    return {
+                        name: entry for name, entry in status["connections"].items()
+                        if isinstance(entry, dict)
+                    }
+            return {}
+        except (KeyError, IndexError, TypeError):
+            return {}
+
+    def get_database_type(self, connection_name: str) -> str:
         """Get database type for a connection"""
-        for conn in connections:
-            if conn.get("name") == connection_name:
-                return conn.get("type", "unknown")
-        return "unknown"
+        return self._conn_type.get(connection_name, "unknown")
 
-    def run_comprehensive_test(self) -> None:
-        """Run comprehensive test of all tools with smart discovery"""
-        print("🚀 Starting comprehensive MCP tool test\n")
+    def run_comprehensive_test(self, buffered: bool = False) -> None:
+        """Run comprehensive test of all tools with smart discovery
+        
+        With buffered=True all output is collected and written to stdout in a
+        single write at the end instead of one write per line.
+        """
+        if buffered:
+            self._log = io.StringIO()
+        try:
+            self._run_comprehensive_test()
+        finally:
+            if self._log is not None:
+                sys.stdout.write(self._log.getvalue())
+                sys.stdout.flush()
+                self._log = None
+    
+    def _run_comprehensive_test(self) -> None:
+        self._p("🚀 Starting comprehensive MCP tool test\n")
         
         # Initialize server
         if not self.initialize_server():
@@ -352,13 +522,13 @@ class MCPTester:
         if not tools:
             sys.exit(1)
         
-        print("\n📝 Available tools:")
+        self._p("\n📝 Available tools:")
         for tool in tools:
-            print(f"  • {tool['name']}: {tool['description']}")
+            self._p(f"  • {tool['name']}: {tool['description']}")
         
         all_results = []
         
-        print("\n🧪 Step 1: Testing basic tools...")
+        self._p("\n🧪 Step 1: Testing basic tools...")
         
         # Test basic tools that don't require parameters
         basic_tests = [
@@ -371,154 +541,170 @@ class MCPTester:
         # Extract connection information
         connections_result = basic_tests[0]
         connections = self.extract_connections_from_response(connections_result)
+        self._conn_type = {c["name"]: c.get("type", "unknown") for c in connections if "name" in c}
         
         if not connections:
-            print("❌ No connections found, cannot proceed with database tests")
+            self._p("❌ No connections found, cannot proceed with database tests")
             self.print_test_summary(all_results)
             return
         
-        print(f"✅ Found {len(connections)} connections")
+        self._p(f"✅ Found {len(connections)} connections")
         
-        # Test each connection
+        # Report per-connection status from the all-connections response
+        statuses = self.extract_connection_status_from_response(basic_tests[2])
         for connection_info in connections:
-            connection_name = connection_info["name"]
-            db_type = connection_info["type"]
-            
-            print(f"\n🔗 Step 2: Testing connection '{connection_name}' (type: {db_type})")
-            
-            # Test connection-specific tools
-            connection_tests = self.test_with_connection(connection_name)
-            all_results.extend(connection_tests)
-            
-            # Get databases
-            databases_result = connection_tests[0]  # list_databases result
-            if not databases_result.success or databases_result.error:
-                print(f"❌ Failed to list databases for {connection_name}")
-                continue
-                
-            databases = self.extract_databases_from_response(databases_result)
-            if not databases:
-                print(f"⚠️  No databases found for {connection_name}")
-                continue
-                
-            print(f"✅ Found databases: {databases[:3]}{'...' if len(databases) > 3 else ''}")
-            
-            # Test with first available database
-            test_database = databases[0]
-            print(f"\n📊 Step 3: Testing database operations on '{test_database}'")
+            status = statuses.get(connection_info["name"])
+            if status:
+                error = f" ({status['error']})" if status.get("error") else ""
+                self._p(f"  • {connection_info['name']}: {status.get('status', 'unknown')}{error}")
+        
+        # Connections are independent, so test them concurrently; each
+        # connection's log is printed in order once all have finished
+        names = [connection_info["name"] for connection_info in connections]
+        try:
+            with ThreadPoolExecutor(max_workers=min(len(names), self.max_workers)) as pool:
+                for results, log in pool.map(self.test_connection_flow, names):
+                    for line in log:
+                        self._p(line)
+                    all_results.extend(results)
+        finally:
+            # Worker threads are gone once the pool shuts down; drop their connections
+            self._close_worker_connections()
+        
+        # Print summary
+        self._p(f"\n🎯 Testing completed!")
+        self.print_test_summary(all_results)
+    
+    def test_connection_flow(self, connection_name: str) -> Tuple[List[TestResult], List[str]]:
+        """Test a connection down to its first table, returning results and log lines"""
+        results: List[TestResult] = []
+        log: List[str] = []
+        db_type = self.get_database_type(connection_name)
+        
+        log.append(f"\n🔗 Step 2: Testing connection '{connection_name}' (type: {db_type})")
+        
+        # Test connection-specific tools
+        connection_tests = self.test_with_connection(connection_name)
+        results.extend(connection_tests)
+        
+        # Get databases
+        databases_result = connection_tests[0]  # list_databases result
+        if not databases_result.success or databases_result.error:
+            log.append(f"❌ Failed to list databases for {connection_name}")
+            return results, log
             
-            # Test schemas if PostgreSQL
-            if db_type == "postgres":
-                print(f"  🏗️  Testing schemas (PostgreSQL)")
-                schemas_result = self.call_tool("list_schemas", {
-                    "connection": connection_name,
-                    "database": test_database
-                })
-                all_results.append(schemas_result)
-                
-                if schemas_result.success:
-                    schemas = self.extract_databases_from_response(schemas_result)  # Reuse same logic
-                    if schemas:
-                        print(f"  ✅ Found schemas: {schemas}")
-                        test_schema = schemas[0]
-                    else:
-                        test_schema = "public"  # Default PostgreSQL schema
-                else:
-                    test_schema = "public"
-            else:
-                test_schema = None
+        databases = self.extract_databases_from_response(databases_result)
+        if not databases:
+            log.append(f"⚠️  No databases found for {connection_name}")
+            return results, log
             
-            # Test list_tables
-            print(f"  📋 Testing tables in database '{test_database}'")
-            tables_args = {
+        log.append(f"✅ Found databases: {databases[:3]}{'...' if len(databases) > 3 else ''}")
+        
+        # Test with first available database
+        test_database = databases[0]
+        log.append(f"\n📊 Step 3: Testing database operations on '{test_database}'")
+        
+        # Test schemas if PostgreSQL
+        if db_type == "postgres":
+            log.append(f"  🏗️  Testing schemas (PostgreSQL)")
+            schemas_result = self.call_tool("list_schemas", {
                 "connection": connection_name,
                 "database": test_database
-            }
-            if test_schema:
-                tables_args["schema"] = test_schema
-                
-            tables_result = self.call_tool("list_tables", tables_args)
-            all_results.append(tables_result)
-            
-            if not tables_result.success or tables_result.error:
-                print(f"  ❌ Failed to list tables")
-                continue
-                
-            tables = self.extract_tables_from_response(tables_result)
-            if not tables:
-                print(f"  ⚠️  No tables found")
-                continue
-                
-            print(f"  ✅ Found tables: {tables[:5]}{'...' if len(tables) > 5 else ''}")
+            })
+            results.append(schemas_result)
             
-            # Test with first available table
-            test_table = tables[0]
-            print(f"\n🗂️  Step 4: Testing table operations on '{test_table}'")
-            
-            # Prepare table arguments
-            table_args = {
-                "connection": connection_name,
-                "database": test_database,
-                "table": test_table
-            }
-            if test_schema:
-                table_args["schema"] = test_schema
-            
-            # Test describe_table
-            print(f"    🔍 Describing table structure")
-            describe_result = self.call_tool("describe_table", table_args)
-            all_results.append(describe_result)
-            
-            # Test list_indexes
-            print(f"    📇 Listing table indexes")
-            indexes_result = self.call_tool("list_indexes", table_args)
-            all_results.append(indexes_result)
+            if schemas_result.success:
+                schemas = self.extract_databases_from_response(schemas_result)  # Reuse same logic
+                if schemas:
+                    log.append(f"  ✅ Found schemas: {schemas}")
+                    test_schema = schemas[0]
+                else:
+                    test_schema = "public"  # Default PostgreSQL schema
+            else:
+                test_schema = "public"
+        else:
+            test_schema = None
+        
+        # Test list_tables
+        log.append(f"  📋 Testing tables in database '{test_database}'")
+        tables_args = {
+            "connection": connection_name,
+            "database": test_database
+        }
+        if test_schema:
+            tables_args["schema"] = test_schema
             
-            # Test get_table_sample
-            print(f"    📄 Getting table sample (5 rows)")
-            sample_args = table_args.copy()
-            sample_args["limit"] = 5
-            sample_result = self.call_tool("get_table_sample", sample_args)
-            all_results.append(sample_result)
+        tables_result = self.call_tool("list_tables", tables_args)
+        results.append(tables_result)
+        
+        if not tables_result.success or tables_result.error:
+            log.append(f"  ❌ Failed to list tables")
+            return results, log
             
-            if sample_result.success:
-                print(f"    ✅ Retrieved sample data")
-            else:
-                print(f"    ❌ Failed to get sample: {sample_result.error}")
+        tables = self.extract_tables_from_response(tables_result)
+        if not tables:
+            log.append(f"  ⚠️  No tables found")
+            return results, log
             
-            # Only test first connection to avoid too many requests
-            break
+        log.append(f"  ✅ Found tables: {tables[:5]}{'...' if len(tables) > 5 else ''}")
         
-        # Print summary
-        print(f"\n🎯 Testing completed!")
-        self.print_test_summary(all_results)
+        # Test with first available table
+        test_table = tables[0]
+        log.append(f"\n🗂️  Step 4: Testing table operations on '{test_table}'")
+        
+        # Prepare table arguments
+        table_args = {
+            "connection": connection_name,
+            "database": test_database,
+            "table": test_table
+        }
+        if test_schema:
+            table_args["schema"] = test_schema
+        
+        # Test describe_table, list_indexes and get_table_sample in one batch
+        log.append(f"    🔍 Describing table structure")
+        log.append(f"    📇 Listing table indexes")
+        log.append(f"    📄 Getting table sample (5 rows)")
+        table_results = self.call_tools_batch([
+            ("describe_table", table_args),
+            ("list_indexes", table_args),
+            ("get_table_sample", {**table_args, "limit": 5}),
+        ])
+        results.extend(table_results)
+        sample_result = table_results[2]
+        
+        if sample_result.success:
+            log.append(f"    ✅ Retrieved sample data")
+        else:
+            log.append(f"    ❌ Failed to get sample: {sample_result.error}")
+        
+        return results, log
     
     def print_test_summary(self, results: List[TestResult]) -> None:
         """Print a summary of all test results"""
-        print("\n" + "="*60)
-        print("📊 TEST SUMMARY")
-        print("="*60)
+        self._p("\n" + "="*60)
+        self._p("📊 TEST SUMMARY")
+        self._p("="*60)
         
-        success_count = sum(1 for r in results if r.success)
-        total_count = len(results)
+        # Group by success/failure in a single pass
+        successful, failed = [], []
+        for r in results:
+            (successful if r.success else failed).append(r)
+        success_count, total_count = len(successful), len(results)
         
-        print(f"\nOverall: {success_count}/{total_count} tests passed")
-        
-        # Group by success/failure
-        successful = [r for r in results if r.success]
-        failed = [r for r in results if not r.success]
+        self._p(f"\nOverall: {success_count}/{total_count} tests passed")
         
         if successful:
-            print(f"\n✅ Successful tests ({len(successful)}):")
+            self._p(f"\n✅ Successful tests ({len(successful)}):")
             for result in successful:
-                print(f"  • {result.tool_name}")
+                self._p(f"  • {result.tool_name}")
         
         if failed:
-            print(f"\n❌ Failed tests ({len(failed)}):")
+            self._p(f"\n❌ Failed tests ({len(failed)}):")
             for result in failed:
-                print(f"  • {result.tool_name}: {result.error}")
+                self._p(f"  • {result.tool_name}: {result.error}")
         
-        print("\n" + "="*60)
+        self._p("\n" + "="*60)
 
 
 def main():
@@ -535,27 +721,43 @@ def main():
         "--tool",
         help="Test specific tool only"
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=8,
+        help="Maximum database connections tested concurrently, each worker "
+             "using its own HTTP connection (default: 8)"
+    )
+    parser.add_argument(
+        "--buffered",
+        action="store_true",
+        help="Write comprehensive test output in one go at the end (for CI logs)"
+    )
     
     args = parser.parse_args()
     
-    tester = MCPTester(args.url)
+    try:
+        tester = MCPTester(args.url, args.max_workers)
+    except ValueError as e:
+        parser.error(str(e))
     
-    if args.tool:
-        # Test specific tool
-        print(f"🧪 Testing tool: {args.tool}")
-        if not tester.initialize_server():
-            sys.exit(1)
-        
-        result = tester.call_tool(args.tool, {})
-        if result.success:
-            print(f"✅ {args.tool} - Success")
-            print(json.dumps(result.response, indent=2))
+    with tester:
+        if args.tool:
+            # Test specific tool
+            print(f"🧪 Testing tool: {args.tool}")
+            if not tester.initialize_server():
+                sys.exit(1)
+        
+            result = tester.call_tool(args.tool, {})
+            if result.success:
+                print(f"✅ {args.tool} - Success")
+                print(json.dumps(result.response, indent=2))
+            else:
+                print(f"❌ {args.tool} - Failed: {result.error}")
+                sys.exit(1)
         else:
-            print(f"❌ {args.tool} - Failed: {result.error}")
-            sys.exit(1)
-    else:
-        # Run comprehensive test
-        tester.run_comprehensive_test()
+            # Run comprehensive test
+            tester.run_comprehensive_test(buffered=args.buffered)
 
 
 if __name__ == "__main__":